@@ -74,6 +74,8 @@ class SLIT_Starlets(object):
                 "The python package pySAP is not used for starlet operations. "
                 "They will be performed using (slower) python routines."
             )
+        # pySAP transforms, keyed by (n_scales, n_pixels)
+        self._transf_cache = {}
         self._fast_inverse = fast_inverse
         self._second_gen = second_gen
         self._show_pysap_plots = show_pysap_plots
@@ -175,17 +177,17 @@ class SLIT_Starlets(object):
 
     def _inverse_transform(self, coeffs, n_scales, n_pixels):
         """Reconstructs image from starlet coefficients."""
-        self._check_transform_pysap(n_scales, n_pixels)
         if self._fast_inverse and not self._second_gen:
-            # for 1st gen starlet the reconstruction can be performed by summing all scales
-            image = np.sum(coeffs, axis=0)
-        else:
-            coeffs = self._coeffs2pysap(coeffs)
-            self._transf.analysis_data = coeffs
-            result = self._transf.synthesis()
-            if self._show_pysap_plots:
-                result.show()
-            image = result.data
+            # for 1st gen starlet the reconstruction can be performed by summing all scales,
+            # no pySAP transform is needed
+            return np.sum(coeffs, axis=0)
+        self._check_transform_pysap(n_scales, n_pixels)
+        coeffs = self._coeffs2pysap(coeffs)
+        self._transf.analysis_data = coeffs
+        result = self._transf.synthesis()
+        if self._show_pysap_plots:
+            result.show()
+        image = result.data
         return image
 
     def _transform(self, image, n_scales):
@@ -200,17 +202,19 @@ class SLIT_Starlets(object):
         return coeffs
 
     def _check_transform_pysap(self, n_scales, n_pixels):
-        """If needed, update the loaded pySAP transform to correct number of scales."""
-        if (
-            not hasattr(self, "_transf")
-            or n_scales != self._n_scales
-            or n_pixels != self._n_pixels
-        ):
-            self._transf = self._transf_class(
+        """If needed, update the loaded pySAP transform to correct number of scales.
+
+        Transforms are cached for each combination of number of scales and pixels, such
+        that alternating between different settings does not re-instantiate them.
+        """
+        key = (n_scales, n_pixels)
+        if key not in self._transf_cache:
+            self._transf_cache[key] = self._transf_class(
                 nb_scale=n_scales, verbose=False, nb_procs=self.thread_count
             )
-            self._n_scales = n_scales
-            self._n_pixels = n_pixels
+        self._transf = self._transf_cache[key]
+        self._n_scales = n_scales
+        self._n_pixels = n_pixels
 
     def _pysap2coeffs(self, coeffs):
         """Convert pySAP decomposition coefficients to numpy array."""
@@ -218,10 +222,8 @@ class SLIT_Starlets(object):
 
     def _coeffs2pysap(self, coeffs):
         """Convert coefficients stored in numpy array to list required by pySAP."""
-        coeffs_list = []
-        for i in range(coeffs.shape[0]):
-            coeffs_list.append(coeffs[i, :, :])
-        return coeffs_list
+        # iterating over the first axis yields views of each scale, without copies
+        return list(coeffs)
 
     def _load_pysap(self, force_no_pysap):
         """Load pySAP module."""
@@ -1,8 +1,10 @@
 __author__ = "herjy", "aymgal", "sibirrer"
 
 import numpy as np
+from functools import lru_cache
 from scipy import ndimage
 
+from lenstronomy.Util import numba_util
 from lenstronomy.Util.package_util import exporter
 
 export, __all__ = exporter()
@@ -12,22 +14,15 @@ export, __all__ = exporter()
 def transform(img, n_scales, second_gen=False):
     """Performs starlet decomposition of an 2D array.
 
-    :param img: input image
+    :param img: input image, or stack of images with shape (n_images, n1, n2) that are
+        decomposed independently along their last two axes
     :param n_scales: number of decomposition scales
     :param second_gen: if True, 'second generation' starlets are used
     """
-    mode = "nearest"
-
     lvl = n_scales - 1
     sh = np.shape(img)
 
-    n1 = sh[1]
-    n2 = sh[1]
-
-    # B-spline filter
-    h = [1.0 / 16, 1.0 / 4, 3.0 / 8, 1.0 / 4, 1.0 / 16]
-    n = np.size(h)
-    h = np.array(h)
+    n2 = sh[-1]
 
     max_lvl = np.min((lvl, int(np.log2(n2))))
     if lvl > max_lvl:
@@ -39,74 +34,155 @@ def transform(img, n_scales, second_gen=False):
 
     c = img
     # wavelet set of coefficients.
-    wave = np.zeros((lvl + 1, n1, n2))
+    wave = np.zeros((lvl + 1,) + sh)
 
     for i in range(lvl):
-        newh = np.zeros((1, n + (n - 1) * (2**i - 1)))
-        newh[0, np.linspace(0, np.size(newh) - 1, len(h), dtype=int)] = h
-
-        # H = np.dot(newh.T, newh)
-
         ######Calculates c(j+1)
-        ###### Line convolution
-        cnew = ndimage.convolve1d(c, newh[0, :], axis=0, mode=mode)
-
-        ###### Column convolution
-        cnew = ndimage.convolve1d(cnew, newh[0, :], axis=1, mode=mode)
+        ###### Line and column convolution
+        cnew = _smooth(c, i)
 
         if second_gen:
-            ###### hoh for g; Column convolution
-            hc = ndimage.convolve1d(cnew, newh[0, :], axis=0, mode=mode)
-
-            ###### hoh for g; Line convolution
-            hc = ndimage.convolve1d(hc, newh[0, :], axis=1, mode=mode)
+            ###### hoh for g; Line and column convolution
+            hc = _smooth(cnew, i)
 
             ###### wj+1 = cj - hcj+1
-            wave[i, :, :] = c - hc
+            wave[i] = c - hc
 
         else:
             ###### wj+1 = cj - cj+1
-            wave[i, :, :] = c - cnew
+            wave[i] = c - cnew
 
         c = cnew
 
-    wave[i + 1, :, :] = c
+    wave[i + 1] = c
 
     return wave
 
 
 @export
-def inverse_transform(wave, fast=True, second_gen=False):
+def inverse_transform(wave, fast=True, second_gen=False, out=None):
     """Reconstructs an image fron its starlet decomposition coefficients.
 
     :param wave: input coefficients, with shape (n_scales, np.sqrt(n_pixel),
-        np.sqrt(n_pixel))
+        np.sqrt(n_pixel)), or (n_scales, n_images, np.sqrt(n_pixel), np.sqrt(n_pixel))
+        for a stack of decompositions
     :param fast: if True, and only with second_gen is False, simply sums up all scales
         to reconstruct the image
     :param second_gen: if True, 'second generation' starlets are used
+    :param out: optional pre-allocated array with the shape of a single scale, in which
+        the reconstructed image is written and returned
     """
     if fast and not second_gen:
         # simply sum all scales, including the coarsest one
-        return np.sum(wave, axis=0)
+        return np.add.reduce(wave, axis=0, out=out)
 
-    mode = "nearest"
-
-    lvl, n1, n2 = np.shape(wave)
-    h = np.array([1.0 / 16, 1.0 / 4, 3.0 / 8, 1.0 / 4, 1.0 / 16])
-    n = np.size(h)
+    lvl = np.shape(wave)[0]
 
-    cJ = np.copy(wave[lvl - 1, :, :])
+    if out is None:
+        cJ = np.copy(wave[lvl - 1])
+    else:
+        cJ = out
+        cJ[...] = wave[lvl - 1]
 
     for i in range(1, lvl):
-        newh = np.zeros((1, n + (n - 1) * (2 ** (lvl - 1 - i) - 1)))
-        newh[0, np.linspace(0, np.size(newh) - 1, len(h), dtype=int)] = h
-        H = np.dot(newh.T, newh)
+        ###### Line and column convolution
+        cnew = _smooth(cJ, lvl - 1 - i)
+
+        np.add(cnew, wave[lvl - 1 - i], out=cJ)
+
+    return cJ
 
-        ###### Line convolution
-        cnew = ndimage.convolve1d(cJ, newh[0, :], axis=0, mode=mode)
-        ###### Column convolution
-        cnew = ndimage.convolve1d(cnew, newh[0, :], axis=1, mode=mode)
 
-        cJ = cnew + wave[lvl - 1 - i, :, :]
+def _smooth(img, scale):
+    """Separable convolution of the last two axes of an image (or stack of images) with
+    the dilated B-spline filter at a given scale, with 'nearest' boundary conditions.
 
-    return np.reshape(cJ, (n1, n2))
+    :param img: 2D image or stack of images
+    :param scale: int, index of the decomposition scale
+    :return: smoothed image, same shape as img
+    """
+    if numba_util.numba_enabled:
+        shape = np.shape(img)
+        img_3d = np.ascontiguousarray(np.reshape(img, (-1,) + shape[-2:]), dtype=float)
+        img_smooth = _smooth_jit(img_3d, _dilated_filter(0), 2**scale)
+        return np.reshape(img_smooth, shape)
+    newh = _dilated_filter(scale)
+    if len(newh) > 32:
+        # at coarse scales the dilated filter is mostly zeros, only the non-zero taps
+        # are applied as shifted copies of the image
+        img_smooth = _convolve_dilated(img, scale, axis=-2)
+        return _convolve_dilated(img_smooth, scale, axis=-1)
+    img_smooth = ndimage.convolve1d(img, newh, axis=-2, mode="nearest")
+    return ndimage.convolve1d(img_smooth, newh, axis=-1, mode="nearest")
+
+
+def _convolve_dilated(img, scale, axis):
+    """Convolution along one axis with the dilated B-spline filter at a given scale,
+    with 'nearest' boundary conditions, computed as a weighted sum of shifted copies of
+    the image. The cost does not depend on the scale.
+
+    :param img: image or stack of images
+    :param scale: int, index of the decomposition scale
+    :param axis: int, axis along which the convolution is performed
+    :return: convolved image, same shape as img
+    """
+    h = _dilated_filter(0)
+    half = len(h) // 2
+    n = np.shape(img)[axis]
+    img_conv = np.zeros(np.shape(img))
+    for j, h_j in enumerate(h):
+        index = np.clip(np.arange(n) + (j - half) * 2**scale, 0, n - 1)
+        img_conv += h_j * np.take(img, index, axis=axis)
+    return img_conv
+
+
+@numba_util.jit()
+def _smooth_jit(img, h, step):
+    """Compiled version of _smooth() that only loops over the non-zero taps of the
+    dilated filter, such that its cost does not increase with the scale.
+
+    :param img: 3D array, stack of images to be smoothed along the last two axes
+    :param h: 1D array, un-dilated filter with odd number of taps
+    :param step: int, spacing between the filter taps (2**scale)
+    :return: smoothed stack of images
+    """
+    n_img, n1, n2 = img.shape
+    n_h = len(h)
+    half = n_h // 2
+    img_line = np.empty_like(img)
+    img_smooth = np.empty_like(img)
+    for k in range(n_img):
+        # line convolution
+        for x in range(n1):
+            for y in range(n2):
+                value = 0.0
+                for j in range(n_h):
+                    x_j = min(max(x + (j - half) * step, 0), n1 - 1)
+                    value += h[j] * img[k, x_j, y]
+                img_line[k, x, y] = value
+        # column convolution
+        for x in range(n1):
+            for y in range(n2):
+                value = 0.0
+                for j in range(n_h):
+                    y_j = min(max(y + (j - half) * step, 0), n2 - 1)
+                    value += h[j] * img_line[k, x, y_j]
+                img_smooth[k, x, y] = value
+    return img_smooth
+
+
+@lru_cache(maxsize=None)
+def _dilated_filter(scale):
+    """B-spline filter of the 'a trous' algorithm at a given decomposition scale, with
+    2**scale - 1 zeros inserted between each of its taps. Filters are cached as they
+    only depend on the scale.
+
+    :param scale: int, index of the decomposition scale
+    :return: 1D (read-only) array of the dilated filter
+    """
+    h = np.array([1.0 / 16, 1.0 / 4, 3.0 / 8, 1.0 / 4, 1.0 / 16])
+    n = np.size(h)
+    newh = np.zeros(n + (n - 1) * (2**scale - 1))
+    newh[:: 2**scale] = h
+    newh.flags.writeable = False
+    return newh
@@ -1,7 +1,7 @@
 import numpy as np
 import lenstronomy.Util.param_util as param_util
 import lenstronomy.Util.util as util
-from scipy import signal
+from scipy import fft
 from lenstronomy.Util.kin_sampling_util import KinNNImageAlign
 from lenstronomy.Sampling.Likelihoods import kinematic_NN_call
 
@@ -19,6 +19,7 @@ class KinLikelihood(object):
         kwargs_data,
         idx_lens=0,
         idx_lens_light=0,
+        fft_workers=None,
     ):
         """
         :param kinematic_data_2d_class: KinBin class instance
@@ -27,12 +28,15 @@ class KinLikelihood(object):
         :param kwargs_data: kwargs describing image rotation
         :param idx_lens: int, index of the LensModel mass profile to consider for kinematics
         :param idx_lens_light: int, index of the lens LightModel profile to consider for kinematics
+        :param fft_workers: int or None, number of workers used for the FFT convolutions with the PSF
+         (see scipy.fft); -1 uses all CPU cores, None uses the scipy default (single thread)
         """
         self.lens_model_class = lens_model_class
         self.z_lens = self.lens_model_class.z_lens
         self.lens_light_model_class = lens_light_model_class
         self._idx_lens = idx_lens
         self._idx_lens_light = idx_lens_light
+        self._fft_workers = fft_workers
         self.kin_class = kinematic_bin_2d_class
 
         # setup KinematicNN and KinNNImagealign class inputs to be updated when called
@@ -57,6 +61,38 @@ class KinLikelihood(object):
         self.psf = self.kin_class.PSF.kernel_point_source
         self.bin_mask = self.kin_class.bin_mask
         self.covariance = self.kin_class.covariance
+        self._cov_inv = np.linalg.inv(self.covariance)
+
+        # flattened bin index of each pixel for the vectorized binning in auto_binning();
+        # pixels not assigned to any data bin are collected in an extra overflow bin
+        self._n_bins = len(self.data)
+        bin_mask_flat = np.array(self.bin_mask).ravel().astype(np.intp)
+        bin_mask_flat[(bin_mask_flat < 0) | (bin_mask_flat >= self._n_bins)] = (
+            self._n_bins
+        )
+        self._bin_mask_flat = bin_mask_flat
+        self._bin_pixel_count = np.bincount(
+            bin_mask_flat, minlength=self._n_bins + 1
+        )[: self._n_bins]
+
+        # real FFT of the PSF, zero-padded to the shape of the full linear convolution,
+        # computed once and reused for each convolution in auto_binning(). The
+        # convolutions are performed in single precision, the binning accumulates in
+        # double precision.
+        map_shape = np.shape(self.bin_mask)
+        psf_shape = np.shape(self.psf)
+        self._fft_shape = tuple(
+            fft.next_fast_len(n_map + n_psf - 1, real=True)
+            for n_map, n_psf in zip(map_shape, psf_shape)
+        )
+        self._psf_fft = fft.rfftn(
+            np.asarray(self.psf, dtype=np.float32), s=self._fft_shape
+        )
+        # central part of the full convolution, equivalent to mode='same'
+        self._same_slice = tuple(
+            slice((n_psf - 1) // 2, (n_psf - 1) // 2 + n_map)
+            for n_map, n_psf in zip(map_shape, psf_shape)
+        )
 
         self.kin_x_grid, self.kin_y_grid = self.kin_class.kin_grid()
 
@@ -93,20 +129,31 @@ class KinLikelihood(object):
             kwargs_lens, kwargs_lens_light, kwargs_special
         )
         if self.kinematic_NN.SKiNN_installed:
-            velo_map = self.kinematic_NN.generate_map(input_params, verbose=verbose)
-            velo_map = self.rescale_distance(
-                velo_map, kwargs_special
-            )  # RESCALE ACCORDING TO D_d, D_dt
-            # Rotation and interpolation in kin data coordinates
-            self.kinNN_input["image"] = velo_map
-            self.KiNNalign.update(self.kin_input, self.image_input, self.kinNN_input)
-            self.rotated_velo = self.KiNNalign.interp_image()
-            # Convolution by PSF to calculate Vrms and binning
-            vrms = self.auto_binning(self.rotated_velo, self.light_map)
-            return vrms
+            return self._vrms_from_nn(input_params, kwargs_special, verbose=verbose)
         else:
             return np.nan
 
+    def _vrms_from_nn(self, input_params, kwargs_special, verbose=False):
+        """Calculates binned vrms using SKiNN, given the NN input parameters and with
+        the image input and light map already updated for the current lens model.
+
+        :param input_params: parameters in GLEE convention to be input into NN
+        :param kwargs_special: cosmology and other kwargs
+        :param verbose: default False; if True print statements when out of bounds
+        :return: binned vrms [km/s]
+        """
+        velo_map = self.kinematic_NN.generate_map(input_params, verbose=verbose)
+        velo_map = self.rescale_distance(
+            velo_map, kwargs_special
+        )  # RESCALE ACCORDING TO D_d, D_dt
+        # Rotation and interpolation in kin data coordinates
+        self.kinNN_input["image"] = velo_map
+        self.KiNNalign.update(self.kin_input, self.image_input, self.kinNN_input)
+        self.rotated_velo = self.KiNNalign.interp_image()
+        # Convolution by PSF to calculate Vrms and binning
+        vrms = self.auto_binning(self.rotated_velo, self.light_map)
+        return vrms
+
     def logL(self, kwargs_lens, kwargs_lens_light, kwargs_special, verbose=False):
         """Calculates Log likelihood from 2D kinematic likelihood.
 
@@ -132,8 +179,9 @@ class KinLikelihood(object):
             ):
                 # params not within training set. Penalty
                 return -(10**8)
-            self.vrms = self.calc_vrms(
-                kwargs_lens, kwargs_lens_light, kwargs_special, verbose=verbose
+            # image input and light map are already updated, only evaluate the NN
+            self.vrms = self._vrms_from_nn(
+                input_params, kwargs_special, verbose=verbose
             )
             logL = self._logL(self.vrms)
         else:
@@ -241,24 +289,53 @@ class KinLikelihood(object):
         vrms = rotated_map
         mge_car = light_map
 
-        vrms = signal.fftconvolve(vrms, self.psf, mode="same")
-        mge_car_con = signal.fftconvolve(mge_car, self.psf, mode="same")
+        # both maps are convolved in a single batched FFT
+        vrms, mge_car_con = self._convolve_psf(
+            np.array([vrms, mge_car], dtype=np.float32)
+        )
 
-        numerator = []
-        denominator = []
+        empty_bins = np.flatnonzero(self._bin_pixel_count == 0)
+        if len(empty_bins) > 0:
+            raise ValueError(
+                "binmap mismatch with data: no pixels in bin with idx %i"
+                % (empty_bins[0])
+            )
+        weights = mge_car_con.ravel()
+        numerator = np.bincount(
+            self._bin_mask_flat,
+            weights=vrms.ravel() * weights,
+            minlength=self._n_bins + 1,
+        )[: self._n_bins]
+        denominator = np.bincount(
+            self._bin_mask_flat, weights=weights, minlength=self._n_bins + 1
+        )[: self._n_bins]
+
+        # bincount outputs are freshly allocated, operate in place
+        np.clip(denominator, 0, None, out=denominator)
+        vrms = np.divide(numerator, denominator, out=numerator)
 
-        for idx in range(len(self.data)):
-            math_pos = np.where(self.bin_mask == idx)
-            if np.shape(math_pos[0])[0] == 0:
-                raise ValueError(
-                    "binmap mismatch with data: no pixels in bin with idx %i" % (idx)
-                )
-            numerator.append(np.sum(vrms[math_pos] * mge_car_con[math_pos]))
-            denominator.append(np.sum(mge_car_con[math_pos]))
+        return vrms
 
-        vrms = np.array(numerator) / np.array(denominator).clip(0)
+    def _convolve_psf(self, image):
+        """Convolves an image in kinematic data pixel coordinates with the PSF, using
+        the pre-computed Fourier transform of the PSF.
 
-        return vrms
+        :param image: 2D array with the shape of the bin mask, or stack of such arrays
+            that are convolved along their last two axes
+        :return: convolved image, same as scipy.signal.fftconvolve(image, psf,
+            mode='same') (in single precision for single precision input)
+        """
+        axes = (-2, -1)
+        image_fft = fft.rfftn(
+            image, s=self._fft_shape, axes=axes, workers=self._fft_workers
+        )
+        image_conv = fft.irfftn(
+            image_fft * self._psf_fft,
+            s=self._fft_shape,
+            axes=axes,
+            workers=self._fft_workers,
+        )
+        return image_conv[(Ellipsis,) + self._same_slice]
 
     def _logL(self, vrms):
         """Calculates the log likelihood for a given binned model.
@@ -266,12 +343,8 @@ class KinLikelihood(object):
         :param vrms: binned vrms [km/s] to compare with observed binned data
         :return: log likelihood
         """
-        # log_like = (vrms - self.data)**2 / self.noise**2
-        cov_inv = np.linalg.inv(self.covariance)
-        log_like = np.matmul(
-            np.matmul((vrms - self.data).T, cov_inv), (vrms - self.data)
-        )
-        logL = -np.sum(log_like) / 2
+        delta = vrms - self.data
+        logL = -np.dot(delta, np.dot(self._cov_inv, delta)) / 2
 
         if not np.isfinite(logL):
             return -(10**15)
@@ -73,6 +73,7 @@ class LikelihoodModule(object):
         kinematic_2d_likelihood=False,
         kin_lens_idx=0,
         kin_lens_light_idx=0,
+        kinematic_fft_workers=None,
         tracer_likelihood=False,
         tracer_likelihood_mask=None,
     ):
@@ -122,6 +123,9 @@ class LikelihoodModule(object):
         :param kwargs_pixelbased: keyword arguments with various settings related to the
             pixel-based solver (see SLITronomy documentation)
         :param kinematic_2d_likelihood: bool, option to compute the kinematic likelihood
+        :param kinematic_fft_workers: int or None, number of workers for the FFT
+            convolutions of the 2D kinematic likelihood (see scipy.fft); -1 uses all CPU
+            cores, None uses the scipy default (single thread)
         :param tracer_likelihood: option to perform likelihood on tracer quantity derived from imaging or spectroscopy
         """
         # TODO unpack also tracer model from kwargs_data
@@ -235,6 +239,7 @@ class LikelihoodModule(object):
                 )
             self._kin_lens_idx = kin_lens_idx
             self._kin_lens_light_idx = kin_lens_light_idx
+            self._kinematic_fft_workers = kinematic_fft_workers
         self._class_instances(
             kwargs_model=kwargs_model,
             kwargs_image_sim=self._kwargs_image_sim,
@@ -322,6 +327,7 @@ class LikelihoodModule(object):
                 kwargs_imaging["multi_band_list"][0][0],
                 self._kin_lens_idx,
                 self._kin_lens_light_idx,
+                fft_workers=self._kinematic_fft_workers,
             )
 
     def __call__(self, a):
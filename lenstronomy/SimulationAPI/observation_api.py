@@ -216,6 +216,46 @@ class SingleBand(Instrument, Observation):
         self._data_count_unit = data_count_unit
         self._background_noise = background_noise
         self._magnitude_zero_point = magnitude_zero_point
+        self._reset_noise_cache()
+
+    def update_observation(
+        self,
+        exposure_time=None,
+        sky_brightness=None,
+        seeing=None,
+        num_exposures=None,
+        psf_type=None,
+        kernel_point_source=None,
+    ):
+        """Updates class instance with new properties if specific argument is not None.
+        Cached sky brightness and background noise levels are re-computed at the next
+        access.
+
+        :param exposure_time: exposure time per image (in seconds)
+        :param sky_brightness: sky brightness (in magnitude per square arcseconds)
+        :param seeing: full width at half maximum of the PSF (if not specific psf_model
+            is specified)
+        :param num_exposures: number of exposures that are combined
+        :param psf_type: string, type of PSF ('GAUSSIAN' and 'PIXEL' supported)
+        :param kernel_point_source: 2d numpy array, model of PSF centered with odd
+            number of pixels per axis (optional when psf_type='PIXEL' is chosen)
+        :return: None, updated class instance
+        """
+        Observation.update_observation(
+            self,
+            exposure_time=exposure_time,
+            sky_brightness=sky_brightness,
+            seeing=seeing,
+            num_exposures=num_exposures,
+            psf_type=psf_type,
+            kernel_point_source=kernel_point_source,
+        )
+        self._reset_noise_cache()
+
+    def _reset_noise_cache(self):
+        """Deletes the cached sky brightness and background noise levels."""
+        self._sky_brightness_cps_cache = None
+        self._bkg_noise_cache = None
 
     @property
     def sky_brightness(self):
@@ -225,7 +265,8 @@ class SingleBand(Instrument, Observation):
         """
         cps = self._sky_brightness_cps
         if self._data_count_unit == "ADU":
-            cps /= self.ccd_gain
+            # not in place, cps is the cached value
+            cps = cps / self.ccd_gain
         return cps
 
     @property
@@ -234,10 +275,11 @@ class SingleBand(Instrument, Observation):
 
         :return: sky brightness in electrons per second
         """
-        cps = data_util.magnitude2cps(
-            self._sky_brightness, magnitude_zero_point=self._magnitude_zero_point
-        )
-        return cps
+        if self._sky_brightness_cps_cache is None:
+            self._sky_brightness_cps_cache = data_util.magnitude2cps(
+                self._sky_brightness, magnitude_zero_point=self._magnitude_zero_point
+            )
+        return self._sky_brightness_cps_cache
 
     @property
     def background_noise(self):
@@ -246,20 +288,22 @@ class SingleBand(Instrument, Observation):
         :return: sqrt(variance) of background noise level in data units
         """
         if self._background_noise is None:
-            if self._read_noise is None:
-                raise ValueError(
-                    "read_noise is not specified to evaluate background noise!"
+            if self._bkg_noise_cache is None:
+                if self._read_noise is None:
+                    raise ValueError(
+                        "read_noise is not specified to evaluate background noise!"
+                    )
+                bkg_noise = data_util.bkg_noise(
+                    self._read_noise,
+                    self._exposure_time,
+                    self._sky_brightness_cps,
+                    self.pixel_scale,
+                    num_exposures=self._num_exposures,
                 )
-            bkg_noise = data_util.bkg_noise(
-                self._read_noise,
-                self._exposure_time,
-                self._sky_brightness_cps,
-                self.pixel_scale,
-                num_exposures=self._num_exposures,
-            )
-            if self._data_count_unit == "ADU":
-                bkg_noise /= self.ccd_gain
-            return bkg_noise
+                if self._data_count_unit == "ADU":
+                    bkg_noise /= self.ccd_gain
+                self._bkg_noise_cache = bkg_noise
+            return self._bkg_noise_cache
         else:
             if self._read_noise is not None:
                 warnings.warn(
@@ -320,12 +364,15 @@ class SingleBand(Instrument, Observation):
         else:
             g = np.random
         nx, ny = np.shape(model)
-        noise = np.zeros_like(model)
+        if background_noise is not True and poisson_noise is not True:
+            return np.zeros_like(model)
+        # independent Gaussian noise terms are drawn at once from their combined variance
+        variance = 0
         if background_noise is True:
-            noise += g.randn(nx, ny) * self.background_noise
+            variance += self.background_noise**2
         if poisson_noise is True:
-            noise += g.randn(nx, ny) * self.flux_noise(model)
-        return noise
+            variance = variance + self.flux_noise(model) ** 2
+        return g.randn(nx, ny) * np.sqrt(variance)
 
     def estimate_noise(self, image):
         """
@@ -6,86 +6,109 @@ from lenstronomy.ImSim import de_lens
 import pytest
 
 
+@pytest.fixture(scope="module")
+def wls_inputs():
+    """Response matrix, inverse data covariance and data of a well-conditioned linear
+    problem."""
+    A = np.array([[1, 2, 3], [3, 2, 1]], dtype=np.float64).T
+    C_D_inv = np.ones(3)
+    d = np.arange(1, 4, dtype=np.float64)
+    return A, C_D_inv, d
+
+
+@pytest.fixture(scope="module")
+def m_inv_matrices():
+    """Covariance matrices of the linear parameters, non-singular and singular."""
+    M_inv = np.array([[1, -0.5, 1], [-0.5, 3, 0], [1, 0, 2]], dtype=np.float64)
+    M_inv_singular = np.array(
+        [[1, 1, 1], [0.0, 1.0, 0.0], [1.0, 2.0, 1.0]], dtype=np.float64
+    )
+    return M_inv, M_inv_singular
+
+
 class TestDeLens(object):
-    def setup_method(self):
-        pass
-
-    def test_get_param_WLS(self):
-        A = np.array([[1, 2, 3], [3, 2, 1]]).T
-        C_D_inv = np.array([1, 1, 1])
-        d = np.array([1, 2, 3])
-        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d)
-        npt.assert_almost_equal(result[0], 1, decimal=8)
-        npt.assert_almost_equal(result[1], 0, decimal=8)
-        npt.assert_almost_equal(image[0], d[0], decimal=8)
-
-        result_new, cov_error_new, image_new = de_lens.get_param_WLS(
-            A, C_D_inv, d, inv_bool=False
+    @pytest.mark.parametrize("inv_bool", [True, False])
+    def test_get_param_WLS(self, wls_inputs, inv_bool):
+        A, C_D_inv, d = wls_inputs
+        result, cov_error, image = de_lens.get_param_WLS(
+            A, C_D_inv, d, inv_bool=inv_bool
         )
-        npt.assert_almost_equal(result_new[0], result[0], decimal=10)
-        npt.assert_almost_equal(result_new[1], result[1], decimal=10)
-        npt.assert_almost_equal(image_new[0], image[0], decimal=10)
-
-    def test_wls_stability(self):
-        A = np.array([[1, 2, 3], [3, 2, 1]]).T
-        C_D_inv = np.array([0, 0, 0])
-        d = np.array([1, 2, 3])
-        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d)
-        npt.assert_almost_equal(result[0], 0, decimal=8)
-        npt.assert_almost_equal(result[1], 0, decimal=8)
-        npt.assert_almost_equal(image[0], 0, decimal=8)
-
-        A = np.array([[1, 2, 1], [1, 2, 1]]).T
-        d = np.array([1, 2, 3])
-        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=False)
-
-        npt.assert_almost_equal(result[0], 0, decimal=8)
-        npt.assert_almost_equal(result[1], 0, decimal=8)
-        npt.assert_almost_equal(image[0], 0, decimal=8)
-
-        C_D_inv = np.array([1, 1, 1])
+        assert result.dtype == np.float64
+        npt.assert_allclose(result, [1.0, 0.0], atol=1e-8)
+        npt.assert_allclose(image, d, atol=1e-8)
+
+    @pytest.mark.parametrize("inv_bool", [True, False])
+    @pytest.mark.parametrize(
+        "A, C_D_inv",
+        [
+            # vanishing inverse data covariance
+            (np.array([[1, 2, 3], [3, 2, 1]], dtype=np.float64).T, np.zeros(3)),
+            # degenerate response
+            (np.array([[1, 2, 1], [1, 2, 1]], dtype=np.float64).T, np.zeros(3)),
+        ],
+    )
+    def test_wls_stability(self, wls_inputs, A, C_D_inv, inv_bool):
+        d = wls_inputs[2]
+        result, cov_error, image = de_lens.get_param_WLS(
+            A, C_D_inv, d, inv_bool=inv_bool
+        )
+        npt.assert_allclose(result, [0.0, 0.0], atol=1e-8)
+        npt.assert_allclose(image, [0.0, 0.0, 0.0], atol=1e-8)
+
+    @pytest.mark.slow
+    @pytest.mark.parametrize("inv_bool", [True, False])
+    def test_wls_stability_illconditioned(self, wls_inputs, inv_bool):
         A = np.array([[1.0, 2.0, 1.0 + 10 ** (-8.9)], [1.0, 2.0, 1.0]]).T
-        d = np.array([1, 2, 3])
-        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=False)
-        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d, inv_bool=True)
-        npt.assert_almost_equal(result[0], 0, decimal=8)
-        npt.assert_almost_equal(result[1], 0, decimal=8)
-        npt.assert_almost_equal(image[0], 0, decimal=8)
-
-    def test_marginalisation_const(self):
-        A = np.array([[1, 2, 3], [3, 2, 1]]).T
-        C_D_inv = np.array([1, 1, 1])
-        d = np.array([1, 2, 3])
-        result, cov_error, image = de_lens.get_param_WLS(A, C_D_inv, d)
-        logL_marg = de_lens.marginalisation_const(cov_error)
-        npt.assert_almost_equal(logL_marg, -2.2821740957339181, decimal=8)
-
-        M_inv = np.array([[1, 0], [0, 1]])
-        marg_const = de_lens.marginalisation_const(M_inv)
+        C_D_inv, d = wls_inputs[1:]
+        result, cov_error, image = de_lens.get_param_WLS(
+            A, C_D_inv, d, inv_bool=inv_bool
+        )
+        npt.assert_allclose(result, [0.0, 0.0], atol=1e-8)
+        npt.assert_allclose(image, [0.0, 0.0, 0.0], atol=1e-8)
+
+    def test_logdet_equivalence(self, wls_inputs, m_inv_matrices):
+        result, cov_error, image = de_lens.get_param_WLS(*wls_inputs)
+        log_det_old = de_lens.marginalisation_const(cov_error)
+        npt.assert_almost_equal(log_det_old, -2.2821740957339181, decimal=8)
+        log_det = de_lens.marginalization_new(cov_error, d_prior=None)
+        npt.assert_almost_equal(log_det, log_det_old, decimal=9)
+
+        marg_const = de_lens.marginalisation_const(np.eye(2))
         assert marg_const == 0
 
-    def test_margnialization_new(self):
-        M_inv = np.array([[1, -0.5, 1], [-0.5, 3, 0], [1, 0, 2]])
+        M_inv, M_inv_singular = m_inv_matrices
         d_prior = 1000
         m = len(M_inv)
-        log_det = de_lens.marginalization_new(M_inv, d_prior=d_prior)
         log_det_old = de_lens.marginalisation_const(M_inv)
+        log_det = de_lens.marginalization_new(M_inv, d_prior=d_prior)
         npt.assert_almost_equal(
             log_det,
             log_det_old + m / 2.0 * np.log(np.pi / 2.0) - m * np.log(d_prior),
             decimal=9,
         )
 
-        M_inv = np.array([[1, 1, 1], [0.0, 1.0, 0.0], [1.0, 2.0, 1.0]])
-        log_det = de_lens.marginalization_new(M_inv, d_prior=10)
-        log_det_old = de_lens.marginalisation_const(M_inv)
+        log_det_old = de_lens.marginalisation_const(M_inv_singular)
+        log_det = de_lens.marginalization_new(M_inv_singular, d_prior=10)
         npt.assert_almost_equal(log_det, log_det_old, decimal=9)
         npt.assert_almost_equal(log_det, -(10 ** (15)), decimal=10)
 
-        log_det = de_lens.marginalization_new(M_inv, d_prior=None)
-        log_det_old = de_lens.marginalisation_const(M_inv)
+        log_det = de_lens.marginalization_new(M_inv_singular, d_prior=None)
         npt.assert_almost_equal(log_det, log_det_old, decimal=9)
 
+    def test_marginalization_new_no_prior(self, m_inv_matrices, monkeypatch):
+        """Without prior, marginalization_new uses the log-determinant from
+        np.linalg.slogdet of marginalisation_const and no eigenvalue
+        decomposition."""
+
+        def _eig_raise(*args, **kwargs):
+            raise AssertionError("eigenvalue decomposition not expected")
+
+        monkeypatch.setattr(np.linalg, "eig", _eig_raise)
+        for M_inv in m_inv_matrices:
+            assert de_lens.marginalization_new(
+                M_inv, d_prior=None
+            ) == de_lens.marginalisation_const(M_inv)
+
     def test_stable_inv(self):
         m = np.diag(np.ones(10) * 2)
         m_inv = de_lens._stable_inv(m)
@@ -97,18 +120,20 @@ class TestDeLens(object):
         npt.assert_almost_equal(m_inv, m)
 
     def test_solve_stable(self):
-        m = np.array([[2, 1], [1, 2]])
-        r = np.array([2, 1])
+        m = np.array([[2, 1], [1, 2]], dtype=np.float64)
+        r = np.array([2, 1], dtype=np.float64)
         b = de_lens._solve_stable(m, r)
         assert len(b) == 2
         npt.assert_almost_equal(b, [1, 0], decimal=8)
 
-        m = np.array([[0, 0], [0, 0]])
-        r = np.array([1, 1])
+        m = np.zeros((2, 2))
+        r = np.ones(2)
         b_none = de_lens._solve_stable(m, r)
         npt.assert_almost_equal(b_none, [0, 0], decimal=8)
         assert np.shape(b_none) == np.shape(b)
 
 
 if __name__ == "__main__":
-    pytest.main()
+    import sys
+
+    sys.exit(pytest.main([__file__, "-x", "-q"]))
@@ -182,6 +182,33 @@ class TestSLITStarlets(object):
         for i in range(n_scales):
             assert pysap_list[i].shape == coeffs[i].shape
 
+    def test_check_transform_pysap(self):
+        starlets = SLIT_Starlets(force_no_pysap=True)
+        # mock pySAP transform class to test the caching without pySAP installed
+        starlets._transf_class = lambda nb_scale, verbose, nb_procs: object()
+        starlets._check_transform_pysap(3, 400)
+        transf_3 = starlets._transf
+        starlets._check_transform_pysap(4, 400)
+        transf_4 = starlets._transf
+        assert transf_4 is not transf_3
+        starlets._check_transform_pysap(3, 400)
+        assert starlets._transf is transf_3
+        assert starlets._n_scales == 3
+        starlets._check_transform_pysap(3, 900)
+        assert starlets._transf is not transf_3
+        assert len(starlets._transf_cache) == 3
+
+    def test_inverse_transform_fast(self):
+        # fast reconstruction does not require a pySAP transform
+        starlets = SLIT_Starlets(
+            fast_inverse=True, second_gen=False, force_no_pysap=True
+        )
+        image = starlets._inverse_transform(
+            self.test_coeffs, self.n_scales, self.n_pixels
+        )
+        npt.assert_almost_equal(image, np.sum(self.test_coeffs, axis=0), decimal=10)
+        assert not hasattr(starlets, "_transf")
+
     def test_pysap2coeffs(self):
         n_scales = 3
         num_pix = 20
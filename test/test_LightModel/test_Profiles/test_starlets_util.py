@@ -0,0 +1,106 @@
+import numpy as np
+import numpy.testing as npt
+import pytest
+from scipy import ndimage
+
+from lenstronomy.LightModel.Profiles import starlets_util
+from lenstronomy.Util import numba_util
+
+
+class TestStarletsUtil(object):
+    def setup_method(self):
+        np.random.seed(42)
+        self.num_pix = 32
+        self.n_scales = 4
+        self.images = np.random.uniform(size=(3, self.num_pix, self.num_pix))
+
+    def test_transform_stack(self):
+        for second_gen in [False, True]:
+            wave_stack = starlets_util.transform(
+                self.images, self.n_scales, second_gen=second_gen
+            )
+            assert wave_stack.shape == (self.n_scales,) + self.images.shape
+            for k, image in enumerate(self.images):
+                wave = starlets_util.transform(
+                    image, self.n_scales, second_gen=second_gen
+                )
+                npt.assert_allclose(wave_stack[:, k], wave, rtol=1e-12, atol=1e-14)
+
+    def test_inverse_transform_stack(self):
+        for fast, second_gen in [(True, False), (False, False), (False, True)]:
+            wave_stack = starlets_util.transform(
+                self.images, self.n_scales, second_gen=second_gen
+            )
+            images_recon = starlets_util.inverse_transform(
+                wave_stack, fast=fast, second_gen=second_gen
+            )
+            assert images_recon.shape == self.images.shape
+            for k in range(len(self.images)):
+                image_recon = starlets_util.inverse_transform(
+                    wave_stack[:, k], fast=fast, second_gen=second_gen
+                )
+                npt.assert_allclose(
+                    images_recon[k], image_recon, rtol=1e-12, atol=1e-14
+                )
+
+    def test_inverse_transform_out(self):
+        for fast, second_gen in [(True, False), (False, False), (False, True)]:
+            wave = starlets_util.transform(
+                self.images[0], self.n_scales, second_gen=second_gen
+            )
+            image_recon = starlets_util.inverse_transform(
+                wave, fast=fast, second_gen=second_gen
+            )
+            out = np.empty((self.num_pix, self.num_pix))
+            image_recon_out = starlets_util.inverse_transform(
+                wave, fast=fast, second_gen=second_gen, out=out
+            )
+            assert image_recon_out is out
+            npt.assert_allclose(image_recon_out, image_recon, rtol=1e-12)
+            # the coefficients are left untouched
+            npt.assert_allclose(
+                starlets_util.inverse_transform(wave, fast=fast, second_gen=second_gen),
+                image_recon,
+                rtol=1e-12,
+            )
+
+    def test_dilated_filter(self):
+        h = np.array([1.0 / 16, 1.0 / 4, 3.0 / 8, 1.0 / 4, 1.0 / 16])
+        npt.assert_array_equal(starlets_util._dilated_filter(0), h)
+        newh = starlets_util._dilated_filter(2)
+        assert len(newh) == 5 + 4 * 3
+        npt.assert_array_equal(newh[::4], h)
+        assert np.sum(newh) == 1
+        # filters are cached and protected against in-place modification
+        assert starlets_util._dilated_filter(2) is newh
+        assert not newh.flags.writeable
+
+    def test_smooth(self, monkeypatch):
+        # compare the compiled and the scipy.ndimage implementation, including scales
+        # with a dilated filter larger than the image
+        for scale in range(7):
+            newh = starlets_util._dilated_filter(scale)
+            image_smooth = ndimage.convolve1d(
+                self.images, newh, axis=-2, mode="nearest"
+            )
+            image_smooth = ndimage.convolve1d(
+                image_smooth, newh, axis=-1, mode="nearest"
+            )
+            image_smooth_jit = starlets_util._smooth_jit(
+                self.images, starlets_util._dilated_filter(0), 2**scale
+            )
+            npt.assert_allclose(image_smooth_jit, image_smooth, rtol=1e-12)
+            npt.assert_allclose(
+                starlets_util._smooth(self.images[0], scale),
+                image_smooth[0],
+                rtol=1e-12,
+            )
+            monkeypatch.setattr(numba_util, "numba_enabled", False)
+            npt.assert_allclose(
+                starlets_util._smooth(self.images, scale), image_smooth, rtol=1e-12
+            )
+            monkeypatch.undo()
+
+
+if __name__ == "__main__":
+    pytest.main()
@@ -1,5 +1,7 @@
 import numpy as np
 import numpy.testing as npt
+import pytest
+from scipy import signal
 from lenstronomy.Sampling.Likelihoods.kinematic_2D_likelihood import KinLikelihood
 from lenstronomy.LensModel.lens_model import LensModel
 from lenstronomy.LightModel.light_model import LightModel
@@ -213,6 +215,29 @@ class TestKinLikelihood(object):
             )
             assert out_of_bounds_logL == -(10**8)
 
+    def test_logL_binned(self):
+        _KinBin = KinBin(psf_class=self.kinPSF, **self.kwargs_kin)
+        _KinLikelihood = KinLikelihood(
+            _KinBin,
+            self.lensModel,
+            self.lensLightModel,
+            self.kwargs_data,
+            idx_lens=0,
+            idx_lens_light=0,
+        )
+        data = np.array(self.kwargs_kin["bin_data"])
+        npt.assert_almost_equal(_KinLikelihood._logL(data), 0, decimal=10)
+        # one bin off by 1 sigma
+        vrms = np.copy(data)
+        vrms[-1] *= 1.05
+        npt.assert_almost_equal(_KinLikelihood._logL(vrms), -0.5, decimal=10)
+        # all bins off by 1 sigma
+        npt.assert_almost_equal(
+            _KinLikelihood._logL(data * 1.05), -len(data) / 2.0, decimal=10
+        )
+        vrms[0] = np.nan
+        assert _KinLikelihood._logL(vrms) == -(10**15)
+
     def test_convert_to_nn_params(self):
         kwargs_lens_test = [
             {
@@ -348,3 +373,84 @@ class TestKinLikelihood(object):
         vrms = _KinLikelihood.auto_binning(dummy_vrms_map, sharp_image)
         expected = np.mean(dummy_vrms_map) / np.mean(sharp_image) * np.ones(4) / 25.0
         npt.assert_allclose(vrms, expected, rtol=1e-3)
+
+    def test_auto_binning_unassigned_pixels(self):
+        # pixels with a bin index outside of the data bins do not contribute
+        dummy_vrms_map = np.array([[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        sharp_kin_psf = kernel_util.kernel_gaussian(num_pix=5, delta_pix=0.2, fwhm=0.01)
+        kin_psf = PSF(psf_type="PIXEL", kernel_point_source=sharp_kin_psf)
+        kwargs_kin = self.kwargs_kin.copy()
+        kwargs_kin["bin_mask"] = np.array([[0, 0, 1], [0, 0, 1], [2, 2, -1]])
+        kwargs_kin["bin_data"] = np.ones(3)
+        kwargs_kin["bin_cov"] = np.diag(np.ones(3))
+        _KinBin = KinBin(psf_class=kin_psf, **kwargs_kin)
+        _KinLikelihood = KinLikelihood(
+            _KinBin,
+            self.lensModel,
+            self.lensLightModel,
+            self.kwargs_data,
+            idx_lens=0,
+            idx_lens_light=0,
+        )
+        vrms = _KinLikelihood.auto_binning(dummy_vrms_map, np.ones((3, 3)))
+        npt.assert_allclose(vrms, [3, 4.5, 7.5], rtol=1e-3)
+
+        # a data bin without any pixel raises an error
+        kwargs_kin["bin_mask"] = np.array([[0, 0, 0], [0, 0, 0], [2, 2, 2]])
+        _KinBin = KinBin(psf_class=kin_psf, **kwargs_kin)
+        _KinLikelihood = KinLikelihood(
+            _KinBin,
+            self.lensModel,
+            self.lensLightModel,
+            self.kwargs_data,
+            idx_lens=0,
+            idx_lens_light=0,
+        )
+        with pytest.raises(ValueError):
+            _KinLikelihood.auto_binning(dummy_vrms_map, np.ones((3, 3)))
+
+    def test_convolve_psf(self):
+        # cached PSF Fourier transform reproduces a direct 'same' mode convolution
+        for num_pix_psf in [3, 5, 7]:
+            kin_psf_kernel = kernel_util.kernel_gaussian(
+                num_pix=num_pix_psf, delta_pix=0.2, fwhm=0.3
+            )
+            kin_psf = PSF(psf_type="PIXEL", kernel_point_source=kin_psf_kernel)
+            _KinBin = KinBin(psf_class=kin_psf, **self.kwargs_kin)
+            _KinLikelihood = KinLikelihood(
+                _KinBin,
+                self.lensModel,
+                self.lensLightModel,
+                self.kwargs_data,
+                idx_lens=0,
+                idx_lens_light=0,
+            )
+            image = np.random.uniform(size=(3, 3))
+            image_conv = _KinLikelihood._convolve_psf(image)
+            # PSF spectrum is stored in single precision
+            npt.assert_allclose(
+                image_conv,
+                signal.fftconvolve(image, kin_psf_kernel, mode="same"),
+                rtol=1e-5,
+                atol=1e-6,
+            )
+            # multi-threaded FFTs give the same result
+            _KinLikelihood_threads = KinLikelihood(
+                _KinBin,
+                self.lensModel,
+                self.lensLightModel,
+                self.kwargs_data,
+                idx_lens=0,
+                idx_lens_light=0,
+                fft_workers=-1,
+            )
+            npt.assert_allclose(
+                _KinLikelihood_threads._convolve_psf(image), image_conv, atol=1e-12
+            )
+            # stack of images is convolved image by image
+            images = np.random.uniform(size=(2, 3, 3))
+            images_conv = _KinLikelihood._convolve_psf(images)
+            for image, image_conv in zip(images, images_conv):
+                npt.assert_allclose(
+                    image_conv, _KinLikelihood._convolve_psf(image), atol=1e-12
+                )
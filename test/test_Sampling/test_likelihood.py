@@ -352,6 +352,50 @@ class TestLikelihoodModule(object):
             ).flatten()
             npt.assert_almost_equal(logL_nokin - logL, image_averaged_chi2 / 2)
 
+    def test_kinematic_fft_workers(self):
+        # FFT workers option is passed to the 2D kinematic likelihood
+        kwargs_model = {
+            "lens_model_list": ["EPL_Q_PHI"],
+            "lens_light_model_list": ["SERSIC_ELLIPSE_Q_PHI"],
+            "source_light_model_list": ["SERSIC"],
+            "point_source_model_list": ["SOURCE_POSITION"],
+            "fixed_magnification_list": [True],
+            "z_lens": 1,
+        }
+        kwargs_constraints = {
+            "num_point_source_list": [4],
+            "solver_type": "NONE",
+            "Ddt_sampling": True,
+            "kinematic_sampling": True,
+        }
+        binned_dummy_data = np.array([200])
+        kwargs_kin = {
+            "bin_data": binned_dummy_data,
+            "bin_cov": np.diag((binned_dummy_data * 0.05) ** 2),
+            "bin_mask": np.zeros_like(self.kwargs_band["image_data"]),
+            "ra_at_xy_0": -(50 - 1) / 2.0 * 0.1,
+            "dec_at_xy_0": -(50 - 1) / 2.0 * 0.1,
+            "transform_pix2angle": np.array([[1, 0], [0, 1]]) * 0.1,
+        }
+        kinPSF = PSF(
+            psf_type="PIXEL",
+            kernel_point_source=kernel_util.kernel_gaussian(
+                num_pix=9, delta_pix=0.2, fwhm=1.0
+            ),
+        )
+        kwargs_data_kin = self.kwargs_data.copy()
+        kwargs_data_kin["kinematic_data"] = KinBin(psf_class=kinPSF, **kwargs_kin)
+        param_class = Param(kwargs_model, **kwargs_constraints)
+        for fft_workers in [None, -1]:
+            Likelihood = LikelihoodModule(
+                kwargs_data_joint=kwargs_data_kin,
+                kwargs_model=kwargs_model,
+                param_class=param_class,
+                kinematic_2d_likelihood=True,
+                kinematic_fft_workers=fft_workers,
+            )
+            assert Likelihood.kinematic_2D_likelihood._fft_workers == fft_workers
+
     def test_check_bounds(self):
         penalty, bound_hit = self.Likelihood.check_bounds(
             args=[0, 1], lowerLimit=[1, 0], upperLimit=[2, 2], verbose=True
@@ -200,6 +200,34 @@ class TestData(object):
         bkg = self.data_adu.background_noise
         assert bkg == 1
 
+    def test_update_observation(self):
+        # cached noise levels are updated with the observational conditions
+        bkg_e_ = self.data_e_.background_noise
+        sky_e_ = self.data_e_.sky_brightness
+        self.data_e_.update_observation(exposure_time=200, sky_brightness=21.0)
+        kwargs_data = self.kwargs_data.copy()
+        kwargs_data["exposure_time"] = 200
+        kwargs_data["sky_brightness"] = 21.0
+        data_e_new = SingleBand(data_count_unit="e-", **kwargs_data)
+        assert self.data_e_.background_noise != bkg_e_
+        assert self.data_e_.sky_brightness != sky_e_
+        assert self.data_e_.background_noise == data_e_new.background_noise
+        assert self.data_e_.sky_brightness == data_e_new.sky_brightness
+
+    def test_cached_sky_brightness_adu(self):
+        # repeated access does not alter the cached sky brightness
+        kwargs_data = self.kwargs_data.copy()
+        kwargs_data["ccd_gain"] = 2.0
+        kwargs_data["sky_brightness"] = np.array([20.0, 21.0])
+        data_adu = SingleBand(data_count_unit="ADU", **kwargs_data)
+        data_adu_ref = SingleBand(data_count_unit="ADU", **kwargs_data)
+        sky_adu = data_adu.sky_brightness
+        npt.assert_allclose(data_adu.sky_brightness, sky_adu, rtol=1e-12)
+        npt.assert_allclose(data_adu.sky_brightness, sky_adu, rtol=1e-12)
+        npt.assert_allclose(
+            data_adu.background_noise, data_adu_ref.background_noise, rtol=1e-12
+        )
+
     def test_flux_noise(self):
         flux_iid = 50.0
         flux_adu = flux_iid / self.ccd_gain
@@ -226,6 +254,29 @@ class TestData(object):
             model_e_, background_noise=True, poisson_noise=True, seed=None
         )
 
+        # noise level of the realizations matches the estimated noise
+        model_e_ = np.ones((300, 300)) * 100
+        for background_noise, poisson_noise in [
+            (True, True),
+            (True, False),
+            (False, True),
+        ]:
+            noise_e_ = self.data_e_.noise_for_model(
+                model_e_,
+                background_noise=background_noise,
+                poisson_noise=poisson_noise,
+                seed=42,
+            )
+            sigma = np.sqrt(
+                background_noise * self.data_e_.background_noise**2
+                + poisson_noise * self.data_e_.flux_noise(model_e_) ** 2
+            )
+            npt.assert_allclose(np.std(noise_e_), np.mean(sigma), rtol=0.01)
+        noise_e_ = self.data_e_.noise_for_model(
+            model_e_, background_noise=False, poisson_noise=False
+        )
+        npt.assert_array_equal(noise_e_, 0)
+
     def test_estimate_noise(self):
         image_adu = np.ones((10, 10))
         image_e_ = image_adu * self.ccd_gain